@@ -2,225 +2,274 @@
 Portfolio Admin CRUD Interface
 A simple web-based interface for managing projects and certificates.
 Protected by password authentication.
+
+Exposed as the `admin_bp` blueprint, registered by app.py so the API and the
+admin interface share one process and one Supabase client. Admin reads skip
+the per-worker read cache: a write may have been handled by another worker.
 """
 
 import os
-from datetime import datetime
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
-from flask_cors import CORS
-from dotenv import load_dotenv
-from supabase import create_client, Client
-from functools import wraps
-
-# Load environment variables
-load_dotenv()
+from flask import Blueprint, render_template, request, session, redirect, url_for
+from auth import check_password, require_auth
+from db import supabase, select_rows, invalidate_table, select_by_id, get_visit_total, PROJECT_REQUIRED_FIELDS, CERTIFICATE_REQUIRED_FIELDS
+from json_provider import json_response
+from pagination import parse_page, page_response
 
-# Initialize Flask app
-app = Flask(__name__, template_folder="templates", static_folder="static")
-app.secret_key = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
-CORS(app)
+admin_bp = Blueprint("admin", __name__)
 
-# Supabase configuration
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
+# Whether the dashboard page can be rendered; checked once instead of on every request
+_HAS_DASHBOARD_TPL = os.path.exists(os.path.join(admin_bp.root_path, "templates", "admin_dashboard.html"))
 
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Columns the admin dashboard lists and edits (everything but bookkeeping timestamps)
+DASHBOARD_COLUMNS = {
+    "projetos": "id,titulo,descricao,tecnologias,link_github,link_deploy,created_at",
+    "certificados": "id,nome,instituicao,origem,data_conclusao,link_certificado,created_at",
+}
 
 
 # ============================================================================
 # AUTHENTICATION
 # ============================================================================
 
-def login_required(f):
-    """Decorator to require login for admin pages."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if "authenticated" not in session:
-            return redirect(url_for("login"))
-        return f(*args, **kwargs)
-    return decorated_function
-
-
-@app.route("/admin/login", methods=["GET", "POST"])
+@admin_bp.route("/admin/login", methods=["GET", "POST"])
 def login():
     """Admin login page."""
     if request.method == "POST":
         password = request.form.get("password")
-        if password == ADMIN_PASSWORD:
-            session["authenticated"] = True
-            return redirect(url_for("admin_dashboard"))
+        if check_password(password):
+            session["logged_in"] = True
+            return redirect(url_for("admin.admin_dashboard"))
         else:
             return render_template("login.html", error="Invalid password")
-    
+
     return render_template("login.html")
 
 
-@app.route("/admin/logout", methods=["POST"])
+@admin_bp.route("/admin/logout", methods=["POST"])
 def logout():
     """Logout from admin panel."""
     session.clear()
-    return redirect(url_for("login"))
+    return redirect(url_for("admin.login"))
 
 
 # ============================================================================
 # ADMIN DASHBOARD
 # ============================================================================
 
-@app.route("/admin", methods=["GET"])
-@login_required
+@admin_bp.route("/admin", methods=["GET"])
 def admin_dashboard():
-    """Admin dashboard main page."""
-    return render_template("admin_dashboard.html")
+    """Serve the admin dashboard only when user is logged in (session flag)."""
+    if session.get("logged_in"):
+        if _HAS_DASHBOARD_TPL:
+            try:
+                return render_template("admin_dashboard.html"), 200
+            except Exception:
+                pass
+        # If template missing, return a minimal JSON for admin
+        return json_response({"message": "Admin dashboard"}, 200)
+    # Not logged in -> redirect to login
+    return redirect(url_for("admin.login"))
+
+
+@admin_bp.route("/admin/api/dashboard", methods=["GET"])
+@require_auth
+def admin_dashboard_data():
+    """Get projects, certificates and the visit total in one response."""
+    try:
+        return json_response({
+            "projetos": select_rows("projetos", None, "created_at", DASHBOARD_COLUMNS["projetos"])[0],
+            "certificados": select_rows("certificados", None, "created_at", DASHBOARD_COLUMNS["certificados"])[0],
+            "visitas": get_visit_total(),
+        }, 200)
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
 # PROJECTS CRUD
 # ============================================================================
 
-@app.route("/admin/api/projetos", methods=["GET"])
-@login_required
+@admin_bp.route("/admin/api/projetos", methods=["GET"])
+@require_auth
 def admin_get_projects():
-    """Get all projects for admin panel."""
+    """Get a page of projects for admin panel."""
+    try:
+        columns, limit, offset = parse_page()
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
     try:
-        response = supabase.table("projetos").select("*").order("created_at", desc=True).execute()
-        return jsonify(response.data), 200
+        rows, total = select_rows("projetos", None, "created_at", columns, limit, offset)
+        return page_response(rows, total)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/projetos", methods=["POST"])
-@login_required
+@admin_bp.route("/admin/api/projetos", methods=["POST"])
+@require_auth
 def admin_create_project():
     """Create a new project."""
     try:
         data = request.get_json()
-        
+
         # Validate required fields
-        required_fields = ["titulo", "descricao", "tecnologias"]
-        if not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        # Add timestamp
-        data["created_at"] = datetime.utcnow().isoformat()
-        
+        if not isinstance(data, dict):
+            return json_response({"error": "Request body must be a JSON object"}, 400)
+        missing = PROJECT_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return json_response({"error": f"Missing required fields: {', '.join(sorted(missing))}"}, 400)
+
         response = supabase.table("projetos").insert(data).execute()
-        return jsonify(response.data), 201
+        invalidate_table("projetos")
+        return json_response(response.data, 201)
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
+
+
+@admin_bp.route("/admin/api/projetos/<int:project_id>", methods=["GET"])
+@require_auth
+def admin_get_project(project_id):
+    """Get a project."""
+    try:
+        row = select_by_id("projetos", project_id)
+        if row is None:
+            return json_response({"error": "Project not found"}, 404)
+        return json_response(row, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/projetos/<int:project_id>", methods=["PUT"])
-@login_required
+@admin_bp.route("/admin/api/projetos/<int:project_id>", methods=["PUT"])
+@require_auth
 def admin_update_project(project_id):
     """Update a project."""
     try:
         data = request.get_json()
-        data["updated_at"] = datetime.utcnow().isoformat()
-        
         response = supabase.table("projetos").update(data).eq("id", project_id).execute()
+        invalidate_table("projetos")
         if not response.data:
-            return jsonify({"error": "Project not found"}), 404
-        return jsonify(response.data[0]), 200
+            return json_response({"error": "Project not found"}, 404)
+        return json_response(response.data[0], 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/projetos/<int:project_id>", methods=["DELETE"])
-@login_required
+@admin_bp.route("/admin/api/projetos/<int:project_id>", methods=["DELETE"])
+@require_auth
 def admin_delete_project(project_id):
     """Delete a project."""
     try:
         supabase.table("projetos").delete().eq("id", project_id).execute()
-        return jsonify({"message": "Project deleted successfully"}), 200
+        invalidate_table("projetos")
+        return json_response({"message": "Project deleted successfully"}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
 # CERTIFICATES CRUD
 # ============================================================================
 
-@app.route("/admin/api/certificados", methods=["GET"])
-@login_required
+@admin_bp.route("/admin/api/certificados", methods=["GET"])
+@require_auth
 def admin_get_certificates():
-    """Get all certificates for admin panel."""
+    """Get a page of certificates for admin panel, optionally filtered by origin."""
+    try:
+        columns, limit, offset = parse_page()
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
     try:
-        response = supabase.table("certificados").select("*").order("created_at", desc=True).execute()
-        return jsonify(response.data), 200
+        origem = request.args.get("origem")
+        filters = {"origem": origem} if origem else None
+        rows, total = select_rows("certificados", filters, "created_at", columns, limit, offset)
+        return page_response(rows, total)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/certificados", methods=["POST"])
-@login_required
+@admin_bp.route("/admin/api/certificados", methods=["POST"])
+@require_auth
 def admin_create_certificate():
     """Create a new certificate."""
     try:
         data = request.get_json()
-        
+
         # Validate required fields
-        required_fields = ["nome", "instituicao", "data_conclusao"]
-        if not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        # Add timestamp
-        data["created_at"] = datetime.utcnow().isoformat()
-        
+        if not isinstance(data, dict):
+            return json_response({"error": "Request body must be a JSON object"}, 400)
+        missing = CERTIFICATE_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return json_response({"error": f"Missing required fields: {', '.join(sorted(missing))}"}, 400)
+
         response = supabase.table("certificados").insert(data).execute()
-        return jsonify(response.data), 201
+        invalidate_table("certificados")
+        return json_response(response.data, 201)
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
+
+
+@admin_bp.route("/admin/api/certificados/<int:cert_id>", methods=["GET"])
+@require_auth
+def admin_get_certificate(cert_id):
+    """Get a certificate."""
+    try:
+        row = select_by_id("certificados", cert_id)
+        if row is None:
+            return json_response({"error": "Certificate not found"}, 404)
+        return json_response(row, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/certificados/<int:cert_id>", methods=["PUT"])
-@login_required
+@admin_bp.route("/admin/api/certificados/<int:cert_id>", methods=["PUT"])
+@require_auth
 def admin_update_certificate(cert_id):
     """Update a certificate."""
     try:
         data = request.get_json()
-        data["updated_at"] = datetime.utcnow().isoformat()
-        
         response = supabase.table("certificados").update(data).eq("id", cert_id).execute()
+        invalidate_table("certificados")
         if not response.data:
-            return jsonify({"error": "Certificate not found"}), 404
-        return jsonify(response.data[0]), 200
+            return json_response({"error": "Certificate not found"}, 404)
+        return json_response(response.data[0], 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
-@app.route("/admin/api/certificados/<int:cert_id>", methods=["DELETE"])
-@login_required
+@admin_bp.route("/admin/api/certificados/<int:cert_id>", methods=["DELETE"])
+@require_auth
 def admin_delete_certificate(cert_id):
     """Delete a certificate."""
     try:
         supabase.table("certificados").delete().eq("id", cert_id).execute()
-        return jsonify({"message": "Certificate deleted successfully"}), 200
+        invalidate_table("certificados")
+        return json_response({"message": "Certificate deleted successfully"}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
-# ERROR HANDLERS
+# VISITS
 # ============================================================================
 
-@app.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors."""
-    return jsonify({"error": "Page not found"}), 404
-
-
-@app.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors."""
-    return jsonify({"error": "Internal server error"}), 500
-
-
-# ============================================================================
-# MAIN ENTRY POINT
-# ============================================================================
+@admin_bp.route("/admin/api/visitas", methods=["GET"])
+@require_auth
+def admin_get_visits():
+    """Get the total number of visits."""
+    try:
+        return json_response({"total": get_visit_total()}, 200)
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
 
-if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5001)
 
+@admin_bp.route("/admin/api/visitas", methods=["POST"])
+@require_auth
+def admin_increment_visits():
+    """Increment the visit counter."""
+    try:
+        # Create or increment the counter row in one statement (see increment_visits_or_init)
+        response = supabase.rpc("increment_visits_or_init", {}).execute()
+        return json_response({"total": response.data}, 200)
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
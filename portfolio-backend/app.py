@@ -1,61 +1,92 @@
 """
 Portfolio Backend API
 A Flask-based REST API for managing portfolio projects, certificates, and visit tracking.
+The admin interface (admin.py) is registered as a blueprint on the same app.
 """
 
 import os
-from datetime import datetime
-from functools import wraps
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+import stat
+from flask import Flask, Response, request, render_template, session, redirect, url_for
 from flask_cors import CORS
+from flask_session import Session
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
+import orjson
+import redis
+from admin import admin_bp
+from auth import ADMIN_PASSWORD, check_password, require_auth
+from db import supabase, cached_select, invalidate_table, select_by_id, get_visit_total, PROJECT_REQUIRED_FIELDS, CERTIFICATE_REQUIRED_FIELDS
+from json_provider import OrjsonProvider, json_response
+from pagination import PUBLIC_LIST_MAX_AGE, parse_ids, parse_page, page_response
 
 # Load environment variables
 load_dotenv()
 
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
+CORS(app, expose_headers=["X-Total-Count"])
 # Minimal secret key for session support (override in production via SECRET_KEY env)
 app.secret_key = os.getenv("SECRET_KEY", "dev-secret-change-me")
 
-# Supabase configuration
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")  # Change in production
-
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Server-side sessions in Redis when REDIS_URL is set; otherwise Flask's signed cookie
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    app.config.update(
+        SESSION_TYPE="redis",
+        SESSION_REDIS=redis.Redis.from_url(REDIS_URL),
+        SESSION_PERMANENT=False,
+        SESSION_USE_SIGNER=True,
+    )
+    Session(app)
+
+# Templates: checked for changes on every render only while debugging; compiled
+# bytecode is kept on disk so workers and restarts skip recompiling them
+FLASK_DEBUG = os.getenv("FLASK_DEBUG", "False").lower() in ("1", "true", "yes")
+JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR")
+
+
+def _bytecode_cache():
+    """Return the template bytecode cache, in JINJA_CACHE_DIR when it is set.
+
+    Cached bytecode is executed when loaded, so an explicit directory must be
+    private to this user. Without one, Jinja picks a per-user directory under
+    the system temp dir and performs the same checks itself.
+    """
+    if not JINJA_CACHE_DIR:
+        return FileSystemBytecodeCache()
+    os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+    info = os.lstat(JINJA_CACHE_DIR)
+    if not stat.S_ISDIR(info.st_mode) or (hasattr(os, "getuid") and info.st_uid != os.getuid()):
+        raise RuntimeError(f"JINJA_CACHE_DIR {JINJA_CACHE_DIR!r} must be a directory owned by the current user")
+    if stat.S_IMODE(info.st_mode) & (stat.S_IWGRP | stat.S_IWOTH):
+        raise RuntimeError(f"JINJA_CACHE_DIR {JINJA_CACHE_DIR!r} must not be writable by other users")
+    return FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+
+app.config["TEMPLATES_AUTO_RELOAD"] = FLASK_DEBUG
+app.jinja_env.auto_reload = FLASK_DEBUG
+app.jinja_env.bytecode_cache = _bytecode_cache()
+
+# Admin interface: login, dashboard and the /admin/api/* endpoints
+app.register_blueprint(admin_bp)
+
+# Compile the admin templates at startup instead of on their first request
+for _template in ("login.html", "admin_dashboard.html"):
+    try:
+        app.jinja_env.get_template(_template)
+    except TemplateNotFound:
+        pass
 
+# Whether the login page can be rendered; checked once instead of on every request
+_HAS_LOGIN_TPL = os.path.exists(os.path.join(app.root_path, "templates", "login.html"))
 
-# ============================================================================
-# AUTHENTICATION DECORATOR
-# ============================================================================
-
-def require_auth(f):
-    """Decorator to protect admin endpoints with password authentication."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            return jsonify({"error": "Missing Authorization header"}), 401
-        
-        try:
-            # Expected format: "Bearer <password>"
-            parts = auth_header.split()
-            if len(parts) != 2 or parts[0] != "Bearer":
-                return jsonify({"error": "Invalid Authorization header"}), 401
-            
-            password = parts[1]
-            if password != ADMIN_PASSWORD:
-                return jsonify({"error": "Unauthorized"}), 401
-        except Exception as e:
-            return jsonify({"error": str(e)}), 401
-        
-        return f(*args, **kwargs)
-    
-    return decorated_function
+# Fixed response bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "ok", "message": "Portfolio API is running"})
+_INDEX_BODY = orjson.dumps({
+    "message": "Portfolio API — use /health or /api/projetos",
+    "endpoints": ["/health", "/api/projetos", "/api/certificados", "/api/visitas"]
+})
 
 
 # ============================================================================
@@ -65,7 +96,7 @@ def require_auth(f):
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint to verify API is running."""
-    return jsonify({"status": "ok", "message": "Portfolio API is running"}), 200
+    return Response(_HEALTH_BODY, mimetype="application/json"), 200
 
 
 # ============================================================================
@@ -74,12 +105,23 @@ def health_check():
 
 @app.route("/api/projetos", methods=["GET"])
 def get_projects():
-    """Retrieve all projects from the database."""
+    """Retrieve a page of projects (newest first), or only those listed in `?ids=1,2,3`."""
     try:
-        response = supabase.table("projetos").select("*").execute()
-        return jsonify(response.data), 200
+        ids = parse_ids()
+        columns, limit, offset = parse_page()
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
+    if ids is not None:
+        # A batch lookup returns every requested row, not just the first page
+        limit, offset = len(ids), 0
+
+    try:
+        filters = {"id": ids} if ids is not None else None
+        rows, total = cached_select("projetos", filters, "created_at", columns, limit, offset)
+        return page_response(rows, total, max_age=PUBLIC_LIST_MAX_AGE)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/projetos", methods=["POST"])
@@ -90,29 +132,29 @@ def create_project():
         data = request.get_json()
         
         # Validate required fields
-        required_fields = ["titulo", "descricao", "tecnologias"]
-        if not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        # Add created_at timestamp
-        data["created_at"] = datetime.utcnow().isoformat()
+        if not isinstance(data, dict):
+            return json_response({"error": "Request body must be a JSON object"}, 400)
+        missing = PROJECT_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return json_response({"error": f"Missing required fields: {', '.join(sorted(missing))}"}, 400)
         
         response = supabase.table("projetos").insert(data).execute()
-        return jsonify(response.data), 201
+        invalidate_table("projetos")
+        return json_response(response.data, 201)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/projetos/<int:project_id>", methods=["GET"])
 def get_project(project_id):
     """Retrieve a specific project by ID."""
     try:
-        response = supabase.table("projetos").select("*").eq("id", project_id).execute()
-        if not response.data:
-            return jsonify({"error": "Project not found"}), 404
-        return jsonify(response.data[0]), 200
+        row = select_by_id("projetos", project_id)
+        if row is None:
+            return json_response({"error": "Project not found"}, 404)
+        return json_response(row, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/projetos/<int:project_id>", methods=["PUT"])
@@ -121,14 +163,13 @@ def update_project(project_id):
     """Update a specific project (admin only)."""
     try:
         data = request.get_json()
-        data["updated_at"] = datetime.utcnow().isoformat()
-        
         response = supabase.table("projetos").update(data).eq("id", project_id).execute()
+        invalidate_table("projetos")
         if not response.data:
-            return jsonify({"error": "Project not found"}), 404
-        return jsonify(response.data[0]), 200
+            return json_response({"error": "Project not found"}, 404)
+        return json_response(response.data[0], 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/projetos/<int:project_id>", methods=["DELETE"])
@@ -137,9 +178,10 @@ def delete_project(project_id):
     """Delete a specific project (admin only)."""
     try:
         response = supabase.table("projetos").delete().eq("id", project_id).execute()
-        return jsonify({"message": "Project deleted successfully"}), 200
+        invalidate_table("projetos")
+        return json_response({"message": "Project deleted successfully"}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
@@ -148,18 +190,28 @@ def delete_project(project_id):
 
 @app.route("/api/certificados", methods=["GET"])
 def get_certificates():
-    """Retrieve all certificates, optionally filtered by origin."""
+    """Retrieve a page of certificates (newest first), optionally filtered by origin and/or `?ids=1,2,3`."""
+    try:
+        ids = parse_ids()
+        columns, limit, offset = parse_page()
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
+    if ids is not None:
+        # A batch lookup returns every requested row, not just the first page
+        limit, offset = len(ids), 0
+
     try:
+        filters = {}
         origem = request.args.get("origem")
-        
         if origem:
-            response = supabase.table("certificados").select("*").eq("origem", origem).execute()
-        else:
-            response = supabase.table("certificados").select("*").execute()
-        
-        return jsonify(response.data), 200
+            filters["origem"] = origem
+        if ids is not None:
+            filters["id"] = ids
+        rows, total = cached_select("certificados", filters, "created_at", columns, limit, offset)
+        return page_response(rows, total, max_age=PUBLIC_LIST_MAX_AGE)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/certificados", methods=["POST"])
@@ -170,29 +222,29 @@ def create_certificate():
         data = request.get_json()
         
         # Validate required fields
-        required_fields = ["nome", "instituicao", "data_conclusao"]
-        if not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        # Add created_at timestamp
-        data["created_at"] = datetime.utcnow().isoformat()
+        if not isinstance(data, dict):
+            return json_response({"error": "Request body must be a JSON object"}, 400)
+        missing = CERTIFICATE_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return json_response({"error": f"Missing required fields: {', '.join(sorted(missing))}"}, 400)
         
         response = supabase.table("certificados").insert(data).execute()
-        return jsonify(response.data), 201
+        invalidate_table("certificados")
+        return json_response(response.data, 201)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/certificados/<int:cert_id>", methods=["GET"])
 def get_certificate(cert_id):
     """Retrieve a specific certificate by ID."""
     try:
-        response = supabase.table("certificados").select("*").eq("id", cert_id).execute()
-        if not response.data:
-            return jsonify({"error": "Certificate not found"}), 404
-        return jsonify(response.data[0]), 200
+        row = select_by_id("certificados", cert_id)
+        if row is None:
+            return json_response({"error": "Certificate not found"}, 404)
+        return json_response(row, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/certificados/<int:cert_id>", methods=["PUT"])
@@ -201,14 +253,13 @@ def update_certificate(cert_id):
     """Update a specific certificate (admin only)."""
     try:
         data = request.get_json()
-        data["updated_at"] = datetime.utcnow().isoformat()
-        
         response = supabase.table("certificados").update(data).eq("id", cert_id).execute()
+        invalidate_table("certificados")
         if not response.data:
-            return jsonify({"error": "Certificate not found"}), 404
-        return jsonify(response.data[0]), 200
+            return json_response({"error": "Certificate not found"}, 404)
+        return json_response(response.data[0], 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/certificados/<int:cert_id>", methods=["DELETE"])
@@ -217,9 +268,10 @@ def delete_certificate(cert_id):
     """Delete a specific certificate (admin only)."""
     try:
         response = supabase.table("certificados").delete().eq("id", cert_id).execute()
-        return jsonify({"message": "Certificate deleted successfully"}), 200
+        invalidate_table("certificados")
+        return json_response({"message": "Certificate deleted successfully"}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
@@ -230,182 +282,20 @@ def delete_certificate(cert_id):
 def get_visits():
     """Retrieve the total number of visits."""
     try:
-        response = supabase.table("visitas").select("total").execute()
-        if response.data:
-            return jsonify({"total": response.data[0]["total"]}), 200
-        else:
-            return jsonify({"total": 0}), 200
+        return json_response({"total": get_visit_total()}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/visitas", methods=["POST"])
 def increment_visits():
     """Increment the visit counter."""
     try:
-        # Get current visit count
-        response = supabase.table("visitas").select("*").execute()
-        
-        if response.data:
-            # Update existing record
-            current_total = response.data[0]["total"]
-            new_total = current_total + 1
-            update_response = supabase.table("visitas").update({"total": new_total}).eq("id", response.data[0]["id"]).execute()
-            return jsonify({"total": new_total}), 200
-        else:
-            # Create new record if it doesn't exist
-            insert_response = supabase.table("visitas").insert({"total": 1}).execute()
-            return jsonify({"total": 1}), 201
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-# ============================================================================
-# ADMIN-PREFixed API (used by the admin dashboard JS)
-# These endpoints use session-based auth (logged_in) instead of the header-based require_auth
-# ============================================================================
-
-
-def _require_logged_in():
-    if not session.get("logged_in"):
-        return False
-    return True
-
-
-@app.route("/admin/api/projetos", methods=["GET", "POST"])
-def admin_projetos():
-    if not _require_logged_in():
-        return jsonify({"error": "Unauthorized"}), 401
-
-    if request.method == "GET":
-        try:
-            response = supabase.table("projetos").select("*").execute()
-            return jsonify(response.data), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    # POST
-    try:
-        data = request.get_json()
-        required_fields = ["titulo", "descricao", "tecnologias"]
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        data["created_at"] = datetime.utcnow().isoformat()
-        response = supabase.table("projetos").insert(data).execute()
-        return jsonify(response.data), 201
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/admin/api/projetos/<int:project_id>", methods=["GET", "PUT", "DELETE"])
-def admin_projeto_detail(project_id):
-    if not _require_logged_in():
-        return jsonify({"error": "Unauthorized"}), 401
-
-    try:
-        if request.method == "GET":
-            response = supabase.table("projetos").select("*").eq("id", project_id).execute()
-            if not response.data:
-                return jsonify({"error": "Project not found"}), 404
-            return jsonify(response.data[0]), 200
-
-        if request.method == "PUT":
-            data = request.get_json()
-            data["updated_at"] = datetime.utcnow().isoformat()
-            response = supabase.table("projetos").update(data).eq("id", project_id).execute()
-            if not response.data:
-                return jsonify({"error": "Project not found"}), 404
-            return jsonify(response.data[0]), 200
-
-        if request.method == "DELETE":
-            response = supabase.table("projetos").delete().eq("id", project_id).execute()
-            return jsonify({"message": "Project deleted successfully"}), 200
+        # Create or increment the counter row in one statement (see increment_visits_or_init)
+        response = supabase.rpc("increment_visits_or_init", {}).execute()
+        return json_response({"total": response.data}, 200)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/admin/api/certificados", methods=["GET", "POST"])
-def admin_certificados():
-    if not _require_logged_in():
-        return jsonify({"error": "Unauthorized"}), 401
-
-    if request.method == "GET":
-        try:
-            origem = request.args.get("origem")
-            if origem:
-                response = supabase.table("certificados").select("*").eq("origem", origem).execute()
-            else:
-                response = supabase.table("certificados").select("*").execute()
-            return jsonify(response.data), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    # POST
-    try:
-        data = request.get_json()
-        required_fields = ["nome", "instituicao", "data_conclusao"]
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        data["created_at"] = datetime.utcnow().isoformat()
-        response = supabase.table("certificados").insert(data).execute()
-        return jsonify(response.data), 201
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/admin/api/certificados/<int:cert_id>", methods=["GET", "PUT", "DELETE"])
-def admin_certificado_detail(cert_id):
-    if not _require_logged_in():
-        return jsonify({"error": "Unauthorized"}), 401
-
-    try:
-        if request.method == "GET":
-            response = supabase.table("certificados").select("*").eq("id", cert_id).execute()
-            if not response.data:
-                return jsonify({"error": "Certificate not found"}), 404
-            return jsonify(response.data[0]), 200
-
-        if request.method == "PUT":
-            data = request.get_json()
-            data["updated_at"] = datetime.utcnow().isoformat()
-            response = supabase.table("certificados").update(data).eq("id", cert_id).execute()
-            if not response.data:
-                return jsonify({"error": "Certificate not found"}), 404
-            return jsonify(response.data[0]), 200
-
-        if request.method == "DELETE":
-            response = supabase.table("certificados").delete().eq("id", cert_id).execute()
-            return jsonify({"message": "Certificate deleted successfully"}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/admin/api/visitas", methods=["GET", "POST"])
-def admin_visitas():
-    # visits endpoint is available to admin dashboard (session) as well
-    if not _require_logged_in():
-        return jsonify({"error": "Unauthorized"}), 401
-
-    try:
-        if request.method == "GET":
-            response = supabase.table("visitas").select("total").execute()
-            if response.data:
-                return jsonify({"total": response.data[0]["total"]}), 200
-            else:
-                return jsonify({"total": 0}), 200
-
-        # POST (increment)
-        response = supabase.table("visitas").select("*").execute()
-        if response.data:
-            current_total = response.data[0]["total"]
-            new_total = current_total + 1
-            supabase.table("visitas").update({"total": new_total}).eq("id", response.data[0]["id"]).execute()
-            return jsonify({"total": new_total}), 200
-        else:
-            supabase.table("visitas").insert({"total": 1}).execute()
-            return jsonify({"total": 1}), 201
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 # ============================================================================
@@ -415,13 +305,13 @@ def admin_visitas():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({"error": "Endpoint not found"}), 404
+    return json_response({"error": "Endpoint not found"}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({"error": "Internal server error"}), 500
+    return json_response({"error": "Internal server error"}, 500)
 
 
 # ============================================================================
@@ -438,71 +328,41 @@ def index():
     # Handle form login submission
     if request.method == "POST":
         password = request.form.get("password")
-        if password and password == ADMIN_PASSWORD:
+        if check_password(password):
             # Mark session as logged in and redirect to admin dashboard
             session["logged_in"] = True
             # Redirecting gives cleaner behavior (avoids form resubmit on refresh)
-            return redirect(url_for("admin_dashboard"))
+            return redirect(url_for("admin.admin_dashboard"))
         else:
             # Invalid password: show login again with error message (if template available)
-            login_path = os.path.join(app.root_path, "templates", "login.html")
-            if os.path.exists(login_path):
+            if _HAS_LOGIN_TPL:
                 try:
                     return render_template("login.html", error="Senha inválida"), 200
                 except Exception:
                     pass
-            return jsonify({"error": "Senha inválida"}), 401
+            return json_response({"error": "Senha inválida"}, 401)
 
     # GET: render login page when available, otherwise return small JSON API description.
-    template_path = os.path.join(app.root_path, "templates", "login.html")
-    if os.path.exists(template_path):
+    if _HAS_LOGIN_TPL:
         try:
             return render_template("login.html"), 200
         except Exception:
             # If rendering fails for any reason, fall back to the JSON response below.
             pass
 
-    return jsonify({
-        "message": "Portfolio API — use /health or /api/projetos",
-        "endpoints": ["/health", "/api/projetos", "/api/certificados", "/api/visitas"]
-    }), 200
-
-
-@app.route("/admin", methods=["GET"])
-def admin_dashboard():
-    """Serve the admin dashboard only when user is logged in (session flag)."""
-    if session.get("logged_in"):
-        dashboard_path = os.path.join(app.root_path, "templates", "admin_dashboard.html")
-        if os.path.exists(dashboard_path):
-            try:
-                return render_template("admin_dashboard.html"), 200
-            except Exception:
-                pass
-        # If template missing, return a minimal JSON for admin
-        return jsonify({"message": "Admin dashboard"}), 200
-    # Not logged in -> redirect to login
-    return redirect(url_for("index"))
-
-
-@app.route("/admin/logout", methods=["POST"])
-def admin_logout():
-    """Clear session and redirect to login. Accepts POST from dashboard logout form."""
-    session.pop("logged_in", None)
-    return redirect(url_for("index"))
+    return Response(_INDEX_BODY, mimetype="application/json"), 200
 
 
 if __name__ == "__main__":
     # Respect environment variables for production vs development
     flask_env = os.getenv("FLASK_ENV", "development")
-    flask_debug_raw = os.getenv("FLASK_DEBUG", "False")
-    flask_debug = str(flask_debug_raw).lower() in ("1", "true", "yes")
 
     # Warn if running with default admin password
     if ADMIN_PASSWORD == "admin123":
         print("WARNING: ADMIN_PASSWORD is set to the default 'admin123'. Change it in production!", flush=True)
 
     if flask_env == "production":
-        print("FLASK_ENV=production detected. Recommended to run with a WSGI server (e.g. gunicorn).", flush=True)
+        print("FLASK_ENV=production detected. Run with gunicorn instead: gunicorn -c gunicorn_conf.py app:app", flush=True)
 
-    app.run(debug=flask_debug, host="0.0.0.0", port=int(os.getenv("PORT", 5000)))
+    app.run(debug=FLASK_DEBUG, host="0.0.0.0", port=int(os.getenv("PORT", 5000)))
 
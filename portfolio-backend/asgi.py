@@ -0,0 +1,37 @@
+"""
+ASGI entry point for running the API under uvicorn.
+Run with: uvicorn asgi:application --workers 4 --loop uvloop
+"""
+
+import asyncio
+import os
+from asgiref.sync import ThreadSensitiveContext
+from asgiref.wsgi import WsgiToAsgi
+from app import app
+
+# Maximum number of requests handled at once per worker process, each in its own thread
+ASGI_THREADS = int(os.getenv("ASGI_THREADS", 300))
+
+
+class ThreadedWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi that runs each request in its own thread, up to ASGI_THREADS at a time.
+
+    Plain WsgiToAsgi runs the WSGI app through a thread-sensitive sync_to_async,
+    which funnels every request of the process into a single thread. Giving each
+    request its own ThreadSensitiveContext lets blocking Supabase calls overlap.
+    """
+
+    def __init__(self, wsgi_application, *args, **kwargs):
+        super().__init__(wsgi_application, *args, **kwargs)
+        self._slots = None
+
+    async def __call__(self, scope, receive, send):
+        if self._slots is None:
+            # Created lazily so it belongs to the server's running event loop
+            self._slots = asyncio.Semaphore(ASGI_THREADS)
+        async with self._slots:
+            async with ThreadSensitiveContext():
+                await super().__call__(scope, receive, send)
+
+
+application = ThreadedWsgiToAsgi(app)
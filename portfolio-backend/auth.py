@@ -0,0 +1,69 @@
+"""
+Admin authentication shared by the API and the admin interface.
+"""
+
+import hmac
+import os
+import threading
+from functools import wraps
+import orjson
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from flask import Response, request, session
+
+# Load environment variables
+load_dotenv()
+
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")  # Change in production
+_ADMIN_PW_BYTES = ADMIN_PASSWORD.encode()
+
+# 401 bodies, serialized once at import
+_MISSING_AUTH_BODY = orjson.dumps({"error": "Missing Authorization header"})
+_INVALID_AUTH_BODY = orjson.dumps({"error": "Invalid Authorization header"})
+_UNAUTHORIZED_BODY = orjson.dumps({"error": "Unauthorized"})
+
+# Authorization headers that already passed the password check. Admin panels send
+# bursts of requests with the same header; entries expire so the check reruns.
+_valid_auth_headers = TTLCache(maxsize=4, ttl=300)
+_valid_auth_headers_lock = threading.Lock()
+
+
+def check_password(password):
+    """Return True when `password` matches ADMIN_PASSWORD, compared in constant time."""
+    return bool(password) and hmac.compare_digest(password.encode(), _ADMIN_PW_BYTES)
+
+
+def _unauthorized(body):
+    return Response(body, status=401, mimetype="application/json")
+
+
+def require_auth(f):
+    """Decorator to protect admin endpoints.
+
+    Accepts either an `Authorization: Bearer <password>` header (API clients) or
+    a session logged in through the login form (the admin dashboard).
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        auth_header = request.headers.get("Authorization")
+        if not auth_header:
+            if session.get("logged_in"):
+                return f(*args, **kwargs)
+            return _unauthorized(_MISSING_AUTH_BODY)
+
+        with _valid_auth_headers_lock:
+            already_valid = auth_header in _valid_auth_headers
+        if already_valid:
+            return f(*args, **kwargs)
+
+        # Expected format: "Bearer <password>"
+        if not auth_header.startswith("Bearer "):
+            return _unauthorized(_INVALID_AUTH_BODY)
+        if not check_password(auth_header[7:].strip()):
+            return _unauthorized(_UNAUTHORIZED_BODY)
+
+        with _valid_auth_headers_lock:
+            _valid_auth_headers[auth_header] = True
+        return f(*args, **kwargs)
+
+    return decorated_function
@@ -0,0 +1,132 @@
+"""
+Supabase access shared by the API and the admin interface: the client and a read cache.
+"""
+
+import os
+import threading
+from functools import lru_cache
+import httpx
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from supabase import create_client, Client, ClientOptions
+from werkzeug.local import LocalProxy
+
+# Load environment variables
+load_dotenv()
+
+# HTTP settings for all Supabase calls of a process
+SUPABASE_TIMEOUT = 30
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
+
+def _build_http_client() -> httpx.Client:
+    """Create the keep-alive connection pool every Supabase request goes through."""
+    # Limits belong on the transport: httpx ignores Client(limits=...) when a transport is given
+    transport = httpx.HTTPTransport(retries=1, limits=SUPABASE_HTTP_LIMITS, http2=True)
+    return httpx.Client(transport=transport, timeout=SUPABASE_TIMEOUT, follow_redirects=True)
+
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Client:
+    """Create the Supabase client on first use and return the same instance afterwards."""
+    options = ClientOptions(httpx_client=_build_http_client())
+    return create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"), options)
+
+
+# Lazy handle so importing a module does not open a client until a handler needs it
+supabase: Client = LocalProxy(get_supabase_client)
+
+# Fields every new row must include
+PROJECT_REQUIRED_FIELDS = frozenset({"titulo", "descricao", "tecnologias"})
+CERTIFICATE_REQUIRED_FIELDS = frozenset({"nome", "instituicao", "data_conclusao"})
+
+
+# ============================================================================
+# QUERY BUILDERS
+# ============================================================================
+
+# PostgREST builders are mutable, so each query starts from a fresh one. These
+# factories keep the select chains of the read paths in one place and resolve
+# the client once per query rather than through the proxy at every call site.
+def select_query(table, columns="*", count=None):
+    """Return a new select builder on `table`; `count="exact"` also requests the row total."""
+    return get_supabase_client().table(table).select(columns, count=count)
+
+
+def select_by_id(table, row_id):
+    """Return the row of `table` whose id is `row_id`, or None when there is none."""
+    response = select_query(table).eq("id", row_id).execute()
+    return response.data[0] if response.data else None
+
+
+# The single visitas row that increment_visits_or_init creates and increments
+VISITS_ROW_ID = 1
+
+
+def get_visit_total():
+    """Return the visit counter, or 0 before the first visit is recorded."""
+    response = select_query("visitas", "total").eq("id", VISITS_ROW_ID).execute()
+    return response.data[0]["total"] if response.data else 0
+
+
+# ============================================================================
+# READ CACHE
+# ============================================================================
+
+# Public list reads change rarely, so they are kept in memory for a short TTL
+# and dropped per table whenever a write goes through this process. The cache
+# is per process: each gunicorn worker keeps and invalidates its own.
+_select_cache = TTLCache(maxsize=128, ttl=60)
+_select_cache_lock = threading.Lock()
+# Bumped by invalidate_table, so a read that overlapped a write does not cache its rows
+_table_generations = {}
+
+
+def select_rows(table, filters=None, order_desc=None, columns="*", limit=None, offset=0):
+    """Return `(rows, total)` for `table` matching `filters`, always fetched from Supabase.
+
+    Filter values are matched with `eq`; tuple values are matched with `in_`.
+    With `limit`, only that page of rows is fetched and `total` is the exact
+    number of matching rows; without it every row is returned and `total` is None.
+    """
+    query = select_query(table, columns, count="exact" if limit is not None else None)
+    for column, value in (filters or {}).items():
+        if isinstance(value, tuple):
+            query = query.in_(column, list(value))
+        else:
+            query = query.eq(column, value)
+    if order_desc:
+        query = query.order(order_desc, desc=True)
+    if limit is not None:
+        query = query.range(offset, offset + limit - 1)
+    response = query.execute()
+    return response.data, response.count
+
+
+def cached_select(table, filters=None, order_desc=None, columns="*", limit=None, offset=0):
+    """Like `select_rows`, but served from this process's memory when cached.
+
+    Only writes handled by this process invalidate the cache, so other workers
+    may serve the previous rows for up to the TTL after a write.
+    """
+    filters = filters or {}
+    key = (table, tuple(sorted(filters.items())), order_desc, columns, limit, offset)
+    with _select_cache_lock:
+        if key in _select_cache:
+            return _select_cache[key]
+        generation = _table_generations.get(table, 0)
+
+    result = select_rows(table, filters, order_desc, columns, limit, offset)
+
+    with _select_cache_lock:
+        if _table_generations.get(table, 0) == generation:
+            _select_cache[key] = result
+    return result
+
+
+def invalidate_table(table):
+    """Drop every cached read of `table` after a write."""
+    with _select_cache_lock:
+        _table_generations[table] = _table_generations.get(table, 0) + 1
+        for key in [key for key in _select_cache.keys() if key[0] == table]:
+            _select_cache.pop(key, None)
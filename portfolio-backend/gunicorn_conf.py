@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for production.
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+
+# Patch the standard library before the app is preloaded, so the sockets used by
+# supabase-py (httpx on top of stdlib socket/ssl) yield to other greenlets.
+from gevent import monkey
+
+monkey.patch_all()
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Every request waits on a Supabase HTTPS call, so cooperative workers serve
+# many requests concurrently instead of one per process.
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", 1000))
+
+# Import the app once in the master process before forking workers
+preload_app = True
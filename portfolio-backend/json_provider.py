@@ -0,0 +1,42 @@
+"""
+orjson-backed JSON provider shared by the API and the admin interface.
+"""
+
+import decimal
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+
+def _default(obj):
+    """Serialize the types Flask's default provider supports but orjson does not."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Parse request bodies and serialize responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=_default), mimetype="application/json")
+
+
+def json_bytes(data):
+    """Serialize `data` with orjson, accepting the same types as the provider."""
+    return orjson.dumps(data, default=_default)
+
+
+def json_response(data, status=200):
+    """Serialize `data` with orjson straight into an application/json response."""
+    return Response(json_bytes(data), status=status, mimetype="application/json")
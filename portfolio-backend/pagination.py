@@ -0,0 +1,79 @@
+"""
+Query-argument parsing and list responses shared by the API and the admin interface.
+"""
+
+import hashlib
+import re
+from flask import Response, request
+from json_provider import json_bytes
+
+# Pagination for list endpoints (`?limit=&offset=`) and column projection (`?fields=`)
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+PUBLIC_LIST_MAX_AGE = 30  # seconds browsers/CDNs may reuse a public list response
+_COLUMNS_PATTERN = re.compile(r"\w+(,\w+)*")
+
+
+def parse_ids():
+    """Parse the optional `?ids=1,2,3` argument into a sorted tuple of ints (None if absent).
+
+    At most MAX_PAGE_SIZE ids are accepted, so the whole batch fits in one page.
+    """
+    ids = request.args.get("ids")
+    if not ids:
+        return None
+    try:
+        parsed = tuple(sorted({int(part) for part in ids.split(",") if part.strip()}))
+    except ValueError:
+        raise ValueError("ids must be a comma-separated list of integers")
+    if not parsed:
+        raise ValueError("ids must be a comma-separated list of integers")
+    if len(parsed) > MAX_PAGE_SIZE:
+        raise ValueError(f"ids must list at most {MAX_PAGE_SIZE} ids")
+    return parsed
+
+
+def _parse_int_arg(name, default):
+    """Read an integer query argument, raising ValueError with a client-facing message."""
+    try:
+        return int(request.args.get(name, default))
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+def parse_page():
+    """Parse `?limit=&offset=&fields=` into `(columns, limit, offset)` for `cached_select`."""
+    limit = min(_parse_int_arg("limit", DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+    offset = _parse_int_arg("offset", 0)
+    if limit < 1 or offset < 0:
+        raise ValueError("limit must be positive and offset must not be negative")
+
+    columns = request.args.get("fields") or "*"
+    if columns != "*" and not _COLUMNS_PATTERN.fullmatch(columns):
+        raise ValueError("fields must be a comma-separated list of column names")
+    return columns, limit, offset
+
+
+def page_response(rows, total, max_age=None):
+    """Return a list response with an ETag and the total row count in `X-Total-Count`.
+
+    Answers 304 without a body when the client's `If-None-Match` already holds
+    the ETag. With `max_age` the response may be cached for that many seconds;
+    otherwise clients must revalidate on every use.
+    """
+    body = json_bytes(rows)
+    etag = hashlib.blake2b(body + str(total).encode(), digest_size=8).hexdigest()
+    # If-None-Match uses weak comparison (RFC 7232), so W/"..." from a compressing proxy still matches
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    if max_age:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    return response
@@ -44,9 +44,7 @@ const elements = {
 
 document.addEventListener('DOMContentLoaded', () => {
     setupEventListeners();
-    loadProjetos();
-    loadCertificados();
-    loadVisitas();
+    loadDashboard();
 });
 
 // ============================================================================
@@ -257,18 +255,17 @@ async function handleFormSubmit(e) {
     const data = Object.fromEntries(formData);
 
     try {
+        // Apply the returned rows locally instead of re-fetching the whole list
         if (state.editingId) {
-            await updateItem(state.editingId, data);
+            const updated = await updateItem(state.editingId, data);
+            setItems(state.currentSection, state[state.currentSection].map(item =>
+                item.id === updated.id ? updated : item
+            ));
         } else {
-            await createItem(data);
+            const created = await createItem(data);
+            setItems(state.currentSection, [...created, ...state[state.currentSection]]);
         }
         closeModals();
-        
-        if (state.currentSection === 'projetos') {
-            loadProjetos();
-        } else {
-            loadCertificados();
-        }
     } catch (error) {
         showToast(error.message, 'error');
     }
@@ -278,34 +275,15 @@ async function handleFormSubmit(e) {
 // API CALLS
 // ============================================================================
 
-async function loadProjetos() {
-    try {
-        const response = await fetch('/admin/api/projetos');
-        if (!response.ok) throw new Error('Erro ao carregar projetos');
-        state.projetos = await response.json();
-        renderProjetos();
-    } catch (error) {
-        showToast(error.message, 'error');
-    }
-}
-
-async function loadCertificados() {
-    try {
-        const response = await fetch('/admin/api/certificados');
-        if (!response.ok) throw new Error('Erro ao carregar certificados');
-        state.certificados = await response.json();
-        renderCertificados();
-    } catch (error) {
-        showToast(error.message, 'error');
-    }
-}
-
-async function loadVisitas() {
+async function loadDashboard() {
+    // Projects, certificates and visits arrive in a single request
     try {
-        const response = await fetch('/admin/api/visitas');
-        if (!response.ok) throw new Error('Erro ao carregar visitas');
+        const response = await fetch('/admin/api/dashboard');
+        if (!response.ok) throw new Error('Erro ao carregar dados');
         const data = await response.json();
-        state.visitas = data.total || 0;
+        setItems('projetos', data.projetos);
+        setItems('certificados', data.certificados);
+        state.visitas = data.visitas || 0;
         elements.visitsCount.textContent = state.visitas.toLocaleString('pt-BR');
     } catch (error) {
         showToast(error.message, 'error');
@@ -329,6 +307,7 @@ async function createItem(data) {
     }
 
     showToast('Item criado com sucesso!', 'success');
+    return response.json();
 }
 
 async function updateItem(id, data) {
@@ -348,6 +327,7 @@ async function updateItem(id, data) {
     }
 
     showToast('Item atualizado com sucesso!', 'success');
+    return response.json();
 }
 
 async function deleteItem(id) {
@@ -384,6 +364,15 @@ async function resetVisits() {
 // RENDERING
 // ============================================================================
 
+function setItems(section, items) {
+    state[section] = items;
+    if (section === 'projetos') {
+        renderProjetos();
+    } else {
+        renderCertificados();
+    }
+}
+
 function renderProjetos() {
     if (state.projetos.length === 0) {
         elements.projetosList.innerHTML = `
@@ -455,14 +444,11 @@ function renderCertificados() {
 
 async function confirmDelete() {
     try {
-        await deleteItem(state.deleteId);
+        const deletedId = state.deleteId;
+        await deleteItem(deletedId);
         closeModals();
-        
-        if (state.currentSection === 'projetos') {
-            loadProjetos();
-        } else {
-            loadCertificados();
-        }
+
+        setItems(state.currentSection, state[state.currentSection].filter(item => item.id !== deletedId));
     } catch (error) {
         showToast(error.message, 'error');
     }
@@ -3,11 +3,73 @@ Unit Tests for Portfolio Backend API
 Tests the main Flask application endpoints
 """
 
+import os
 import pytest
 import json
+from flask import url_for
+from decimal import Decimal
+from types import SimpleNamespace
+import admin
+import app as app_module
+import auth
+import db
 from app import app
 
 
+class FakeQuery:
+    """Stand-in for a PostgREST query builder over a list of rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.bounds = None
+
+    def select(self, *columns, **kwargs):
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def eq(self, column, value):
+        self.rows = [row for row in self.rows if row.get(column) == value]
+        return self
+
+    def in_(self, column, values):
+        self.rows = [row for row in self.rows if row.get(column) in values]
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def execute(self):
+        rows = self.rows
+        if self.bounds is not None:
+            rows = rows[self.bounds[0]:self.bounds[1] + 1]
+        return SimpleNamespace(data=rows, count=len(self.rows))
+
+
+class FakeSupabase:
+    """Stand-in for the Supabase client serving fixed rows per table."""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def table(self, name):
+        return FakeQuery(self.tables.get(name, []))
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    """Route every Supabase call to an in-memory FakeSupabase."""
+    fake = FakeSupabase({})
+    monkeypatch.setattr(db, "get_supabase_client", lambda: fake)
+    for module in (app_module, admin):
+        monkeypatch.setattr(module, "supabase", fake)
+    yield fake
+    for table in ("projetos", "certificados"):
+        db.invalidate_table(table)
+
+
 @pytest.fixture
 def client():
     """Create a test client for the Flask app."""
@@ -72,6 +134,18 @@ class TestProjectsEndpoints:
             json={"titulo": "Test Project"},  # Missing descricao and tecnologias
         )
         assert response.status_code == 400
+        error = json.loads(response.data)["error"]
+        assert "descricao" in error and "tecnologias" in error
+
+    def test_create_project_non_object_body(self, client):
+        """Test POST /api/projetos with a JSON list, string or number returns 400."""
+        for body in ([1, 2], "abc", 3):
+            response = client.post(
+                "/api/projetos",
+                headers={"Authorization": "Bearer admin123"},
+                json=body,
+            )
+            assert response.status_code == 400
 
     def test_invalid_auth_header(self, client):
         """Test invalid Authorization header format returns 401."""
@@ -86,6 +160,30 @@ class TestProjectsEndpoints:
         )
         assert response.status_code == 401
 
+    def test_get_projects_invalid_ids(self, client):
+        """Test GET /api/projetos?ids=... with a non-integer id returns 400."""
+        response = client.get("/api/projetos?ids=1,abc")
+        assert response.status_code == 400
+
+    def test_get_projects_by_ids_ignores_page_size(self, client, fake_supabase):
+        """Test GET /api/projetos?ids=... returns every requested project, even past one page."""
+        fake_supabase.tables["projetos"] = [{"id": i} for i in range(1, 31)]
+        response = client.get("/api/projetos?ids=" + ",".join(str(i) for i in range(1, 30)))
+        assert response.status_code == 200
+        assert len(json.loads(response.data)) == 29
+
+    def test_get_projects_too_many_ids(self, client):
+        """Test GET /api/projetos?ids=... with more ids than fit in one page returns 400."""
+        response = client.get("/api/projetos?ids=" + ",".join(str(i) for i in range(1, 102)))
+        assert response.status_code == 400
+
+    def test_get_projects_invalid_pagination(self, client):
+        """Test GET /api/projetos with bad limit/fields arguments returns 400."""
+        assert client.get("/api/projetos?limit=abc").status_code == 400
+        assert client.get("/api/projetos?offset=-1").status_code == 400
+        assert client.get("/api/projetos?fields=id,titulo(*)").status_code == 400
+        assert client.get("/api/projetos?fields=id%0A").status_code == 400
+
     def test_get_nonexistent_project(self, client):
         """Test GET /api/projetos/{id} with non-existent ID returns 404."""
         response = client.get("/api/projetos/99999")
@@ -150,6 +248,13 @@ class TestVisitsEndpoints:
         assert "total" in data
         assert isinstance(data["total"], int)
 
+    def test_get_visits_reads_counter_row(self, client, fake_supabase):
+        """Test GET /api/visitas reads the row increment_visits_or_init writes (id 1)."""
+        fake_supabase.tables["visitas"] = [{"id": 2, "total": 5}, {"id": 1, "total": 7}]
+        response = client.get("/api/visitas")
+        assert response.status_code == 200
+        assert json.loads(response.data) == {"total": 7}
+
     def test_increment_visits(self, client):
         """Test POST /api/visitas increments counter."""
         # Get initial count
@@ -165,6 +270,104 @@ class TestVisitsEndpoints:
         assert new_count >= initial_count
 
 
+class TestReadCache:
+    """Test the in-process cache in front of list reads."""
+
+    def test_cached_projects_are_served_from_memory(self, client):
+        """Test GET /api/projetos returns the cached rows without hitting Supabase."""
+        rows = [{"id": 1, "titulo": "Cached"}]
+        db._select_cache[("projetos", (), "created_at", "*", 20, 0)] = (rows, 1)
+        try:
+            response = client.get("/api/projetos")
+            assert response.status_code == 200
+            assert json.loads(response.data) == rows
+            assert response.headers["X-Total-Count"] == "1"
+        finally:
+            db.invalidate_table("projetos")
+
+    def test_read_overlapping_a_write_is_not_cached(self, client, fake_supabase, monkeypatch):
+        """Test rows fetched before a write are not cached after that write invalidated the table."""
+        fake_supabase.tables["projetos"] = [{"id": 1, "titulo": "old"}]
+        fetch = FakeQuery.execute
+
+        def execute_during_write(query):
+            response = fetch(query)
+            # A write lands and invalidates the table while this read is in flight
+            fake_supabase.tables["projetos"] = [{"id": 1, "titulo": "new"}]
+            db.invalidate_table("projetos")
+            return response
+
+        monkeypatch.setattr(FakeQuery, "execute", execute_during_write)
+        client.get("/api/projetos")
+        monkeypatch.setattr(FakeQuery, "execute", fetch)
+        response = client.get("/api/projetos")
+        assert json.loads(response.data) == [{"id": 1, "titulo": "new"}]
+
+    def test_conditional_get_returns_304(self, client):
+        """Test GET /api/projetos honors If-None-Match with the returned ETag."""
+        db._select_cache[("projetos", (), "created_at", "*", 20, 0)] = ([{"id": 1}], 1)
+        try:
+            first = client.get("/api/projetos")
+            etag = first.headers["ETag"]
+            second = client.get("/api/projetos", headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            assert second.data == b""
+        finally:
+            db.invalidate_table("projetos")
+
+    def test_conditional_get_accepts_weak_etag(self, client):
+        """Test GET /api/projetos answers 304 when a proxy sent the ETag back as weak."""
+        db._select_cache[("projetos", (), "created_at", "*", 20, 0)] = ([{"id": 1}], 1)
+        try:
+            etag = client.get("/api/projetos").headers["ETag"]
+            response = client.get("/api/projetos", headers={"If-None-Match": "W/" + etag})
+            assert response.status_code == 304
+        finally:
+            db.invalidate_table("projetos")
+
+    def test_list_serializes_decimals(self, client):
+        """Test list responses serialize Decimal values like the other endpoints."""
+        db._select_cache[("projetos", (), "created_at", "*", 20, 0)] = ([{"id": 1, "nota": Decimal("9.5")}], 1)
+        try:
+            response = client.get("/api/projetos")
+            assert response.status_code == 200
+            assert json.loads(response.data) == [{"id": 1, "nota": "9.5"}]
+        finally:
+            db.invalidate_table("projetos")
+
+    def test_cache_key_includes_origem(self, client):
+        """Test GET /api/certificados?origem=... is cached per origin."""
+        rows = [{"id": 1, "nome": "Cert", "origem": "FIAP"}]
+        key = ("certificados", (("origem", "FIAP"),), "created_at", "*", 20, 0)
+        db._select_cache[key] = (rows, 1)
+        try:
+            response = client.get("/api/certificados?origem=FIAP")
+            assert json.loads(response.data) == rows
+        finally:
+            db.invalidate_table("certificados")
+        assert key not in db._select_cache
+
+
+class TestTemplateCache:
+    """Test the directory used for compiled template bytecode."""
+
+    def test_explicit_cache_dir_is_created_private(self, tmp_path, monkeypatch):
+        """Test JINJA_CACHE_DIR is created readable and writable only by its owner."""
+        cache_dir = tmp_path / "jinja"
+        monkeypatch.setattr(app_module, "JINJA_CACHE_DIR", str(cache_dir))
+        app_module._bytecode_cache()
+        assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+    def test_shared_cache_dir_is_rejected(self, tmp_path, monkeypatch):
+        """Test a JINJA_CACHE_DIR other users can write to is refused."""
+        cache_dir = tmp_path / "jinja"
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        monkeypatch.setattr(app_module, "JINJA_CACHE_DIR", str(cache_dir))
+        with pytest.raises(RuntimeError):
+            app_module._bytecode_cache()
+
+
 class TestErrorHandling:
     """Test error handling."""
 
@@ -182,6 +385,57 @@ class TestErrorHandling:
         assert response.status_code == 200
 
 
+class TestAdminSession:
+    """Test the session login of the admin blueprint."""
+
+    def test_login_sets_session(self, client):
+        """Test POST /admin/login with the right password logs in and redirects to /admin."""
+        response = client.post("/admin/login", data={"password": "admin123"})
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/admin")
+        with client.session_transaction() as sess:
+            assert sess.get("logged_in") is True
+
+    def test_logged_in_session_reaches_admin_api(self, client, fake_supabase):
+        """Test a logged-in session calls /admin/api/dashboard without an Authorization header."""
+        fake_supabase.tables["projetos"] = [{"id": 1, "titulo": "Project"}]
+        fake_supabase.tables["visitas"] = [{"id": 1, "total": 3}]
+        with client.session_transaction() as sess:
+            sess["logged_in"] = True
+        response = client.get("/admin/api/dashboard")
+        assert response.status_code == 200
+        assert json.loads(response.data) == {
+            "projetos": [{"id": 1, "titulo": "Project"}],
+            "certificados": [],
+            "visitas": 3,
+        }
+
+    def test_admin_lists_skip_read_cache(self, client, fake_supabase):
+        """Test /admin/api/projetos reads Supabase even when this worker cached an older list."""
+        db._select_cache[("projetos", (), "created_at", "*", 20, 0)] = ([{"id": 1, "titulo": "old"}], 1)
+        fake_supabase.tables["projetos"] = [{"id": 1, "titulo": "new"}]
+        with client.session_transaction() as sess:
+            sess["logged_in"] = True
+        response = client.get("/admin/api/projetos")
+        assert json.loads(response.data) == [{"id": 1, "titulo": "new"}]
+
+    def test_anonymous_admin_api_is_rejected(self, client, fake_supabase):
+        """Test /admin/api/dashboard without a session or header returns 401."""
+        response = client.get("/admin/api/dashboard")
+        assert response.status_code == 401
+
+    def test_logout_clears_session(self, client):
+        """Test POST /admin/logout clears the session and redirects to the login page."""
+        with client.session_transaction() as sess:
+            sess["logged_in"] = True
+        response = client.post("/admin/logout")
+        assert response.status_code == 302
+        with app.test_request_context():
+            assert response.headers["Location"].endswith(url_for("admin.login"))
+        with client.session_transaction() as sess:
+            assert "logged_in" not in sess
+
+
 class TestAuthenticationDecorator:
     """Test authentication decorator functionality."""
 
@@ -211,6 +465,13 @@ class TestAuthenticationDecorator:
         )
         assert response.status_code == 401
 
+    def test_only_valid_headers_are_remembered(self, client):
+        """Test a rejected header is not cached while an accepted one is."""
+        client.post("/api/projetos", headers={"Authorization": "Bearer wrongpassword"}, json={})
+        client.post("/api/projetos", headers={"Authorization": "Bearer admin123"}, json={})
+        assert "Bearer wrongpassword" not in auth._valid_auth_headers
+        assert "Bearer admin123" in auth._valid_auth_headers
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])